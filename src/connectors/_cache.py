@@ -0,0 +1,66 @@
+"""
+In-process TTL cache for connector HTTP responses.
+
+Upstream series (FRED, ECB, DBnomics, e-Stat) change at most daily, so a
+repeat fetch within a connector's CACHE_TTL_SECONDS is served from memory
+instead of going back to the API. Expired entries are kept (until evicted)
+so a failed refresh can fall back to the last good value.
+"""
+import hashlib
+import threading
+import time
+from typing import Any, Optional
+
+import orjson
+
+
+def cache_key(
+    url: str, params: Optional[dict] = None, headers: Optional[dict] = None
+) -> str:
+    """
+    Stable key for a GET request (params/headers order does not matter).
+
+    headers should hold only the request headers that change the response
+    (e.g. Accept, Authorization); the key is a digest, so secrets in them
+    are not kept.
+    """
+    payload = url.encode() + orjson.dumps(
+        [params or {}, headers or {}], option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return entry[1]
+
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Return the cached value even if expired, or None if missing."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry is not None else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,286 @@
+"""
+Shared HTTP plumbing for connectors.
+
+A single process-wide requests.Session keeps TCP+TLS connections alive
+between calls to the same host, so only the first request to e.g.
+api.stlouisfed.org pays for the handshake.
+"""
+import logging
+import re
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+from ._cache import TTLCache, cache_key
+
+logger = logging.getLogger(__name__)
+
+
+# Connection failures retried per request. Read errors get no retries: a
+# hung upstream would otherwise hold a worker and a per-host slot for
+# (retries + 1) * timeout before any stale fallback could run.
+CONNECT_RETRIES = 2
+
+# Longest single wait between retries, whether from backoff or a server's
+# Retry-After. The wait happens inside the adapter, so it holds the caller's
+# per-host slot; an uncapped Retry-After could stall a whole host's fetches.
+MAX_RETRY_WAIT_SECONDS = 5
+
+
+class _CappedRetry(Retry):
+    """Retry that caps backoff and Retry-After waits at MAX_RETRY_WAIT_SECONDS."""
+
+    def get_backoff_time(self) -> float:
+        return min(super().get_backoff_time(), MAX_RETRY_WAIT_SECONDS)
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_WAIT_SECONDS)
+
+
+def _build_session(retries: int = 5) -> requests.Session:
+    """
+    Create a pooled session, retrying transient errors up to retries times.
+
+    Only 429/5xx responses get the full budget; connection failures get at
+    most CONNECT_RETRIES and read timeouts none.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=_CappedRetry(
+            total=retries,
+            connect=min(retries, CONNECT_RETRIES),
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            # Hand back the last 429/5xx instead of raising RetryError, so
+            # connectors report "HTTP <status>" rather than urllib3's message
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    # Advertises br alongside gzip/deflate when brotli is installed, so
+    # urllib3 can always decode whatever encoding the server picks.
+    session.headers.update(make_headers(accept_encoding=True))
+    session.headers["Accept"] = "application/json"
+    session.headers["User-Agent"] = f"meridian {requests.utils.default_user_agent()}"
+    return session
+
+
+SESSION = _build_session()
+# Health probes answer "is it up right now?"; retrying would only delay
+# a False for a host that is already failing.
+HEALTH_SESSION = _build_session(retries=0)
+RESPONSE_CACHE = TTLCache(maxsize=4096)
+
+# Concurrent requests allowed per host, so thread-pooled fetches don't
+# trip anonymous rate limits (OECD, HuggingFace) with a burst
+MAX_REQUESTS_PER_HOST = 4
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+# Cache misses currently being fetched, so concurrent identical requests
+# share one HTTP call instead of each going upstream.
+_INFLIGHT: dict[str, "Future[_CachedResponse]"] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+# Query strings in exception text, which can carry API keys (FRED's api_key)
+_QUERY_STRING = re.compile(r"\?[^\s'\")]*")
+
+
+def describe_error(exc: BaseException) -> str:
+    """Exception text for FetchResult.error, with URL query strings removed."""
+    return _QUERY_STRING.sub("", str(exc))
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Return the semaphore bounding concurrent requests to url's host."""
+    host = urlsplit(url).netloc
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+            _HOST_SLOTS[host] = slot
+        return slot
+
+
+def _limited_get(
+    url: str, params: Optional[dict], **kwargs: Any
+) -> requests.Response:
+    """Session GET, waiting for a free per-host slot first."""
+    with _host_slot(url):
+        return SESSION.get(url, params=params, **kwargs)
+
+
+# Request headers that change what the server sends back, so two calls
+# differing only in these (e.g. VastAI's Authorization) never share an entry
+_VARY_HEADERS = ("Accept", "Authorization")
+# Response headers kept with a cached body: decoding hint and validators
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """The parts of a response worth caching; rebuilt into a Response per caller."""
+    status_code: int
+    content: bytes
+    headers: dict[str, str]
+
+
+def _to_entry(response: requests.Response) -> _CachedResponse:
+    """Detach a response's status, body and kept headers from the connection."""
+    return _CachedResponse(
+        status_code=response.status_code,
+        content=response.content,
+        headers={
+            name: response.headers[name]
+            for name in _KEPT_HEADERS
+            if name in response.headers
+        },
+    )
+
+
+def _to_response(entry: _CachedResponse, url: str) -> requests.Response:
+    """Build a fresh Response around a cached entry."""
+    response = requests.Response()
+    response.status_code = entry.status_code
+    response._content = entry.content
+    response.headers = CaseInsensitiveDict(entry.headers)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.url = url
+    return response
+
+
+def _is_upstream_failure(status_code: int) -> bool:
+    """True for statuses a stale cached response should stand in for."""
+    return status_code == 429 or status_code >= 500
+
+
+def _validators(entry: _CachedResponse) -> dict[str, str]:
+    """Conditional-request headers from a cached entry's ETag/Last-Modified."""
+    headers = {}
+    etag = entry.headers.get("ETag")
+    if etag:
+        headers["If-None-Match"] = etag
+    last_modified = entry.headers.get("Last-Modified")
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def cached_get(
+    url: str, params: Optional[dict] = None, ttl: float = 0, **kwargs: Any
+) -> requests.Response:
+    """
+    GET through the shared session, serving repeats from the response cache.
+
+    Concurrent misses for the same request wait on the first caller's
+    fetch rather than issuing their own. If the refresh fails with a
+    RequestException or a 429/5xx, the last good (expired) response is
+    returned instead. Expired entries are revalidated with
+    If-None-Match/If-Modified-Since, and a 304 re-arms the cached response
+    for another ttl.
+
+    Cache entries hold only status, body and a few headers; every caller
+    gets its own Response built from them.
+
+    Args:
+        url: Request URL
+        params: Query parameters (part of the cache key)
+        ttl: Seconds a successful response stays cached; 0 disables caching
+        **kwargs: Passed through to Session.get (timeout, headers, ...);
+            Accept and Authorization headers are part of the cache key
+
+    Returns:
+        The live or cached response
+    """
+    if ttl <= 0:
+        return _limited_get(url, params, **kwargs)
+
+    request_headers = CaseInsensitiveDict(kwargs.get("headers") or {})
+    vary = {
+        name: request_headers[name]
+        for name in _VARY_HEADERS
+        if name in request_headers
+    }
+    key = cache_key(url, params, vary)
+    cached = RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return _to_response(cached, url)
+
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT.get(key)
+        if pending is None:
+            # A previous leader may have filled the cache since the check above
+            cached = RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return _to_response(cached, url)
+            future: "Future[_CachedResponse]" = Future()
+            _INFLIGHT[key] = future
+    if pending is not None:
+        return _to_response(pending.result(), url)
+
+    try:
+        stale = RESPONSE_CACHE.get_stale(key)
+        if stale is not None:
+            # Revalidate instead of refetching: a 304 has no body to decode
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                **_validators(stale),
+            }
+        try:
+            response = _limited_get(url, params, **kwargs)
+        except requests.RequestException:
+            # Upstream down: serve the last good response if we have one
+            if stale is None:
+                raise
+            logger.warning("Serving stale cached response for %s", url)
+            entry = stale
+        else:
+            if stale is not None and _is_upstream_failure(response.status_code):
+                # 429/5xx that outlasted the retries: upstream is down too
+                logger.warning("Serving stale cached response for %s", url)
+                entry = stale
+            else:
+                if response.status_code == 304 and stale is not None:
+                    entry = stale
+                else:
+                    entry = _to_entry(response)
+                if entry.status_code == 200:
+                    RESPONSE_CACHE.set(key, entry, ttl)
+        future.set_result(entry)
+        return _to_response(entry, url)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body with orjson.
+
+    Decode errors are re-raised as requests.JSONDecodeError (a
+    RequestException) so connectors' existing error handling still applies.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
@@ -6,13 +6,21 @@ All connectors must implement:
 2. normalize() - Convert to standard Observation/Story format
 3. health_check() - Verify API connectivity
 """
+import functools
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+import requests
 
 from ..storage.models import Observation, Story
 
+# First month of each quarter, keyed by quarter number
+QUARTER_MONTH = {"1": "01", "2": "04", "3": "07", "4": "10"}
+
 
 @dataclass
 class ConnectorConfig:
@@ -32,6 +40,9 @@ class ConnectorConfig:
     indicator: Optional[str] = None  # World Bank
     country: Optional[str] = None    # World Bank
     indicator_code: Optional[str] = None  # e-Stat Dashboard
+    # History window (None = connector default)
+    lookback_days: Optional[int] = None  # FRED: observation_start
+    last_n_observations: Optional[int] = None  # ECB: lastNObservations
 
 
 @dataclass
@@ -64,10 +75,34 @@ class FetchResult:
             self.fetched_at = datetime.now()
 
 
+def cached_health_check(method: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """
+    Reuse a connector's health_check() result for HEALTH_CHECK_TTL_SECONDS.
+
+    The result is stored on the instance, so repeated liveness probes
+    don't hit the upstream API every time.
+    """
+    @functools.wraps(method)
+    def wrapper(self) -> bool:
+        now = time.monotonic()
+        cached = getattr(self, "_health_cache", None)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        healthy = method(self)
+        self._health_cache = (now + self.HEALTH_CHECK_TTL_SECONDS, healthy)
+        return healthy
+
+    return wrapper
+
+
 class BaseMetricConnector(ABC):
     """Abstract base for metric data connectors."""
 
     SOURCE_NAME: str = "base"
+    # Seconds a successful fetch response is reused (0 = always refetch)
+    CACHE_TTL_SECONDS: int = 0
+    # Seconds a health_check() result is reused
+    HEALTH_CHECK_TTL_SECONDS: int = 60
 
     @abstractmethod
     def fetch(self, config: ConnectorConfig) -> FetchResult:
@@ -105,6 +140,41 @@ class BaseMetricConnector(ABC):
         """
         return True
 
+    def _http_error(self, response: requests.Response) -> FetchResult:
+        """
+        Failed FetchResult for a non-2xx response.
+
+        The error body is never decoded, so 429/5xx storms cost no parsing.
+        """
+        return FetchResult(
+            success=False,
+            data=[],
+            error=f"HTTP {response.status_code}",
+            source=self.SOURCE_NAME
+        )
+
+    def fetch_many(
+        self, configs: list[ConnectorConfig], max_workers: int = 10
+    ) -> dict[str, FetchResult]:
+        """
+        Fetch several metrics from this source concurrently.
+
+        Requests share the pooled HTTP session, so the API's rate limit
+        rather than per-request latency bounds the batch.
+
+        Args:
+            configs: Metric configurations for this connector
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Mapping of metric_id to FetchResult, in config order
+        """
+        if not configs:
+            return {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.fetch, configs)
+            return {config.metric_id: result for config, result in zip(configs, results)}
+
     def fetch_and_normalize(self, config: ConnectorConfig) -> list[Observation]:
         """
         Convenience method: fetch + normalize in one call.
@@ -13,20 +13,34 @@ API Notes:
 - Returns USD prices by default
 - market_chart endpoint provides historical data
 """
+import logging
 from datetime import datetime
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
+logger = logging.getLogger(__name__)
+
 
 class CoinGeckoConnector(BaseMetricConnector):
     """Connector for CoinGecko cryptocurrency API."""
 
     SOURCE_NAME = "coingecko"
     BASE_URL = "https://api.coingecko.com/api/v3"
+    CACHE_TTL_SECONDS = 60
+    _PING_URL = f"{BASE_URL}/ping"
+    # 30 days of daily prices for sparklines (never mutated by requests)
+    _CHART_PARAMS = {"vs_currency": "usd", "days": "30", "interval": "daily"}
 
     # Map our metric IDs to CoinGecko IDs
     COIN_MAP = {
@@ -46,26 +60,24 @@ class CoinGeckoConnector(BaseMetricConnector):
         Returns:
             FetchResult with historical price data
         """
-        coin_id = self.COIN_MAP.get(config.metric_id)
-        if not coin_id:
-            coin_id = config.series_id or config.metric_id.split(".")[-1]
-
-        # Use market_chart for historical data (30 days)
+        coin_id = self._resolve_coin_id(config)
         url = f"{self.BASE_URL}/coins/{coin_id}/market_chart"
-        params = {
-            "vs_currency": "usd",
-            "days": "30",
-            "interval": "daily"
-        }
 
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            response = cached_get(
+                url,
+                params=self._CHART_PARAMS,
+                ttl=self.CACHE_TTL_SECONDS,
+                timeout=30,
+            )
+            if not response.ok:
+                return self._http_error(response)
+            data = parse_json(response)
 
+            # normalize() only reads prices; drop market_caps/total_volumes
             return FetchResult(
                 success=True,
-                data=data,
+                data={"prices": data.get("prices", [])},
                 source=self.SOURCE_NAME
             )
 
@@ -73,10 +85,18 @@ class CoinGeckoConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
+    def _resolve_coin_id(self, config: ConnectorConfig) -> str:
+        """Map a metric to its CoinGecko ID (COIN_MAP, then series_id, then suffix)."""
+        return (
+            self.COIN_MAP.get(config.metric_id)
+            or config.series_id
+            or config.metric_id.rpartition(".")[2]
+        )
+
     def normalize(self, config: ConnectorConfig, raw_data: Any) -> list[Observation]:
         """
         Convert CoinGecko market_chart data to observations.
@@ -89,6 +109,9 @@ class CoinGeckoConnector(BaseMetricConnector):
         }
         """
         observations = []
+        metric_id, unit = config.metric_id, config.unit or "$"
+        multiplier, decimals = config.multiplier, config.decimals
+        retrieved_at = datetime.now()
 
         try:
             prices = raw_data.get("prices", [])
@@ -104,26 +127,27 @@ class CoinGeckoConnector(BaseMetricConnector):
                 obs_date = datetime.fromtimestamp(timestamp_ms / 1000).strftime("%Y-%m-%d")
 
                 obs = Observation(
-                    metric_id=config.metric_id,
+                    metric_id=metric_id,
                     obs_date=obs_date,
-                    value=round(float(price) * config.multiplier, config.decimals),
-                    unit=config.unit or "$",
+                    value=round(float(price) * multiplier, decimals),
+                    unit=unit,
                     source=self.SOURCE_NAME,
-                    retrieved_at=datetime.now()
+                    retrieved_at=retrieved_at
                 )
                 observations.append(obs)
 
         except (KeyError, ValueError, TypeError) as e:
-            print(f"CoinGecko parse warning: {e}")
+            logger.debug("CoinGecko parse warning: %s", e)
 
         # Sort by date descending (most recent first)
-        observations.sort(key=lambda x: x.obs_date, reverse=True)
+        observations.sort(key=attrgetter("obs_date"), reverse=True)
         return observations
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check CoinGecko API availability."""
         try:
-            response = requests.get(f"{self.BASE_URL}/ping", timeout=10)
+            response = HEALTH_SESSION.get(self._PING_URL, timeout=10)
             return response.status_code == 200
         except requests.RequestException:
             return False
@@ -11,11 +11,19 @@ API Notes:
 - Returns series data with period and value arrays
 """
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    QUARTER_MONTH,
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
 
@@ -24,6 +32,13 @@ class DBnomicsConnector(BaseMetricConnector):
 
     SOURCE_NAME = "dbnomics"
     BASE_URL = "https://api.db.nomics.world/v22"
+    CACHE_TTL_SECONDS = 86400
+    _SERIES_PARAMS = {
+        "observations": 1,  # Include observation data
+        "format": "json",
+    }
+    _PROVIDERS_URL = f"{BASE_URL}/providers"
+    _HEALTH_PARAMS = {"limit": 1}
 
     def fetch(self, config: ConnectorConfig) -> FetchResult:
         """
@@ -55,15 +70,17 @@ class DBnomicsConnector(BaseMetricConnector):
             )
 
         url = f"{self.BASE_URL}/series/{series_path}"
-        params = {
-            "observations": 1,  # Include observation data
-            "format": "json",
-        }
 
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            response = cached_get(
+                url,
+                params=self._SERIES_PARAMS,
+                ttl=self.CACHE_TTL_SECONDS,
+                timeout=30,
+            )
+            if not response.ok:
+                return self._http_error(response)
+            data = parse_json(response)
 
             # DBnomics returns series info with observations
             if "series" not in data or not data["series"].get("docs"):
@@ -87,7 +104,7 @@ class DBnomicsConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -105,6 +122,9 @@ class DBnomicsConnector(BaseMetricConnector):
         }
         """
         observations = []
+        metric_id, unit = config.metric_id, config.unit
+        multiplier, decimals = config.multiplier, config.decimals
+        retrieved_at = datetime.now()
 
         periods = raw_data.get("period", [])
         values = raw_data.get("value", [])
@@ -118,7 +138,7 @@ class DBnomicsConnector(BaseMetricConnector):
                 continue
 
             try:
-                val = float(value) * config.multiplier
+                val = float(value) * multiplier
             except (ValueError, TypeError):
                 continue
 
@@ -126,17 +146,17 @@ class DBnomicsConnector(BaseMetricConnector):
             obs_date = self._parse_period(period)
 
             obs = Observation(
-                metric_id=config.metric_id,
+                metric_id=metric_id,
                 obs_date=obs_date,
-                value=round(val, config.decimals),
-                unit=config.unit,
+                value=round(val, decimals),
+                unit=unit,
                 source=self.SOURCE_NAME,
-                retrieved_at=datetime.now()
+                retrieved_at=retrieved_at
             )
             observations.append(obs)
 
         # Sort by date descending (most recent first)
-        observations.sort(key=lambda x: x.obs_date, reverse=True)
+        observations.sort(key=attrgetter("obs_date"), reverse=True)
         return observations
 
     def _parse_period(self, period: str) -> str:
@@ -148,29 +168,28 @@ class DBnomicsConnector(BaseMetricConnector):
         - 2024-Q1 → 2024-01-01 (quarterly)
         - 2024 → 2024-01-01 (annual)
         """
-        if "-Q" in period:
+        year, sep, quarter = period.partition("-Q")
+        if sep:
             # Quarterly: 2024-Q1 → 2024-01-01
-            year, quarter = period.split("-Q")
-            month = {"1": "01", "2": "04", "3": "07", "4": "10"}[quarter]
-            return f"{year}-{month}-01"
-        elif len(period) == 7:
+            return f"{year}-{QUARTER_MONTH[quarter]}-01"
+
+        n = len(period)
+        if n == 7:
             # Monthly: 2024-01 → 2024-01-01
             return f"{period}-01"
-        elif len(period) == 4:
+        if n == 4:
             # Annual: 2024 → 2024-01-01
             return f"{period}-01-01"
-        else:
-            # Already full date or unknown format
-            return period
+        # Already full date or unknown format
+        return period
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check DBnomics API availability."""
         try:
             # Check API status endpoint
-            response = requests.get(
-                f"{self.BASE_URL}/providers",
-                params={"limit": 1},
-                timeout=10
+            response = HEALTH_SESSION.get(
+                self._PROVIDERS_URL, params=self._HEALTH_PARAMS, timeout=10
             )
             return response.status_code == 200
         except requests.RequestException:
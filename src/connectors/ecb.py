@@ -12,20 +12,37 @@ API Notes:
 - Uses SDMX-JSON format
 - Dataflow format: DATABASE/SERIES_KEY (e.g., FM/M.U2.EUR.4F.KR.DFR.LEV)
 """
+import logging
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    QUARTER_MONTH,
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
+logger = logging.getLogger(__name__)
+
 
 class ECBConnector(BaseMetricConnector):
     """Connector for ECB SDMX API."""
 
     SOURCE_NAME = "ecb"
     BASE_URL = "https://data-api.ecb.europa.eu/service/data"
+    # Matches defaults.history_points in config/metrics.yaml
+    DEFAULT_LAST_N_OBSERVATIONS = 120
+    # Known stable series for health checks (ECB main refinancing rate)
+    _HEALTH_URL = f"{BASE_URL}/FM/M.U2.EUR.4F.KR.MRR_FR.LEV"
+    _HEALTH_PARAMS = {"format": "jsondata", "lastNObservations": 1}
+    CACHE_TTL_SECONDS = 86400
 
     def fetch(self, config: ConnectorConfig) -> FetchResult:
         """
@@ -49,15 +66,20 @@ class ECBConnector(BaseMetricConnector):
         url = f"{self.BASE_URL}/{config.dataflow}/{config.series_key}"
         params = {
             "format": "jsondata",
-            "lastNObservations": 500,
+            "lastNObservations": (
+                config.last_n_observations or self.DEFAULT_LAST_N_OBSERVATIONS
+            ),
         }
 
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
+            response = cached_get(
+                url, params=params, ttl=self.CACHE_TTL_SECONDS, timeout=30
+            )
+            if not response.ok:
+                return self._http_error(response)
             return FetchResult(
                 success=True,
-                data=response.json(),
+                data=parse_json(response),
                 source=self.SOURCE_NAME
             )
 
@@ -65,7 +87,7 @@ class ECBConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -98,6 +120,9 @@ class ECBConnector(BaseMetricConnector):
         }
         """
         observations = []
+        metric_id, unit = config.metric_id, config.unit
+        multiplier, decimals = config.multiplier, config.decimals
+        retrieved_at = datetime.now()
 
         try:
             # Extract time dimension values
@@ -124,7 +149,7 @@ class ECBConnector(BaseMetricConnector):
                 return []
 
             # Get first series (usually only one for specific series_key)
-            first_series = list(series.values())[0]
+            first_series = next(iter(series.values()))
             obs_data = first_series.get("observations", {})
 
             for idx_str, values in obs_data.items():
@@ -142,21 +167,21 @@ class ECBConnector(BaseMetricConnector):
                 obs_date = self._parse_time_period(time_period)
 
                 obs = Observation(
-                    metric_id=config.metric_id,
+                    metric_id=metric_id,
                     obs_date=obs_date,
-                    value=round(float(value) * config.multiplier, config.decimals),
-                    unit=config.unit,
+                    value=round(float(value) * multiplier, decimals),
+                    unit=unit,
                     source=self.SOURCE_NAME,
-                    retrieved_at=datetime.now()
+                    retrieved_at=retrieved_at
                 )
                 observations.append(obs)
 
         except (KeyError, IndexError, TypeError) as e:
             # Log error but return what we have
-            print(f"ECB parse warning: {e}")
+            logger.debug("ECB parse warning: %s", e)
 
         # Sort by date descending
-        observations.sort(key=lambda x: x.obs_date, reverse=True)
+        observations.sort(key=attrgetter("obs_date"), reverse=True)
         return observations
 
     def _parse_time_period(self, period: str) -> str:
@@ -168,29 +193,27 @@ class ECBConnector(BaseMetricConnector):
         - 2024-Q1 -> 2024-01-01
         - 2024 -> 2024-01-01
         """
-        if "-Q" in period:
+        year, sep, quarter = period.partition("-Q")
+        if sep:
             # Quarterly: 2024-Q1 -> 2024-01-01
-            year, quarter = period.split("-Q")
-            month = {"1": "01", "2": "04", "3": "07", "4": "10"}[quarter]
-            return f"{year}-{month}-01"
-        elif len(period) == 7:
+            return f"{year}-{QUARTER_MONTH[quarter]}-01"
+
+        n = len(period)
+        if n == 7:
             # Monthly: 2024-01 -> 2024-01-01
             return f"{period}-01"
-        elif len(period) == 4:
+        if n == 4:
             # Annual: 2024 -> 2024-01-01
             return f"{period}-01-01"
-        else:
-            # Already full date or unknown format
-            return period
+        # Already full date or unknown format
+        return period
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check ECB API availability."""
         try:
-            # Fetch a known stable series (ECB main refinancing rate)
-            response = requests.get(
-                f"{self.BASE_URL}/FM/M.U2.EUR.4F.KR.MRR_FR.LEV",
-                params={"format": "jsondata", "lastNObservations": 1},
-                timeout=10
+            response = HEALTH_SESSION.get(
+                self._HEALTH_URL, params=self._HEALTH_PARAMS, timeout=10
             )
             return response.status_code == 200
         except requests.RequestException:
@@ -15,11 +15,19 @@ API Notes:
 - Official source: https://dashboard.e-stat.go.jp/en/static/api
 """
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    QUARTER_MONTH,
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
 
@@ -28,6 +36,10 @@ class EStatDashboardConnector(BaseMetricConnector):
 
     SOURCE_NAME = "estat_dashboard"
     BASE_URL = "https://dashboard.e-stat.go.jp/api/1.0"
+    CACHE_TTL_SECONDS = 86400
+    _DATA_URL = f"{BASE_URL}/Json/getData"
+    # Known stable indicator for health checks (unemployment rate)
+    _HEALTH_PARAMS = {"IndicatorCode": "0301010000020020010"}
 
     def __init__(self):
         """Initialize e-Stat connector (no API key required)."""
@@ -53,15 +65,18 @@ class EStatDashboardConnector(BaseMetricConnector):
                 source=self.SOURCE_NAME
             )
 
-        url = f"{self.BASE_URL}/Json/getData"
-        params = {
-            "IndicatorCode": indicator_code,
-        }
+        params = {"IndicatorCode": indicator_code}
 
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            response = cached_get(
+                self._DATA_URL,
+                params=params,
+                ttl=self.CACHE_TTL_SECONDS,
+                timeout=30,
+            )
+            if not response.ok:
+                return self._http_error(response)
+            data = parse_json(response)
 
             # Check for API errors
             result = data.get('GET_STATS', {}).get('RESULT', {})
@@ -99,7 +114,7 @@ class EStatDashboardConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -120,6 +135,9 @@ class EStatDashboardConnector(BaseMetricConnector):
         }
         """
         observations = []
+        metric_id, unit = config.metric_id, config.unit
+        multiplier, decimals = config.multiplier, config.decimals
+        retrieved_at = datetime.now()
 
         for item in raw_data:
             if not isinstance(item, dict) or 'VALUE' not in item:
@@ -133,7 +151,7 @@ class EStatDashboardConnector(BaseMetricConnector):
                 continue
 
             try:
-                value = float(value_str) * config.multiplier
+                value = float(value_str) * multiplier
             except (ValueError, TypeError):
                 continue
 
@@ -145,17 +163,17 @@ class EStatDashboardConnector(BaseMetricConnector):
                 continue
 
             obs = Observation(
-                metric_id=config.metric_id,
+                metric_id=metric_id,
                 obs_date=obs_date,
-                value=round(value, config.decimals),
-                unit=config.unit,
+                value=round(value, decimals),
+                unit=unit,
                 source=self.SOURCE_NAME,
-                retrieved_at=datetime.now()
+                retrieved_at=retrieved_at
             )
             observations.append(obs)
 
         # Sort by date descending
-        observations.sort(key=lambda x: x.obs_date, reverse=True)
+        observations.sort(key=attrgetter("obs_date"), reverse=True)
         return observations
 
     def _parse_time_period(self, period: str) -> str:
@@ -181,9 +199,7 @@ class EStatDashboardConnector(BaseMetricConnector):
             elif 'Q' in period:
                 # Quarterly: 20243Q00 -> 2024-07-01
                 year = period[:4]
-                quarter = period[4]
-                month_map = {'1': '01', '2': '04', '3': '07', '4': '10'}
-                month = month_map.get(quarter, '01')
+                month = QUARTER_MONTH.get(period[4], '01')
                 return f"{year}-{month}-01"
 
             elif 'CY' in period:
@@ -204,19 +220,17 @@ class EStatDashboardConnector(BaseMetricConnector):
         except (IndexError, ValueError):
             return ""
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check e-Stat Dashboard API availability."""
         try:
-            # Test with a known stable indicator (unemployment rate)
-            response = requests.get(
-                f"{self.BASE_URL}/Json/getData",
-                params={"IndicatorCode": "0301010000020020010"},
-                timeout=10
+            response = HEALTH_SESSION.get(
+                self._DATA_URL, params=self._HEALTH_PARAMS, timeout=10
             )
             if response.status_code != 200:
                 return False
 
-            data = response.json()
+            data = parse_json(response)
             result = data.get('GET_STATS', {}).get('RESULT', {})
             return result.get('status') == '0'
 
@@ -12,12 +12,18 @@ API Notes:
 - Dates in YYYY-MM-DD format
 """
 import os
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Any, Optional
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
 
@@ -26,6 +32,9 @@ class FREDConnector(BaseMetricConnector):
 
     SOURCE_NAME = "fred"
     BASE_URL = "https://api.stlouisfed.org/fred"
+    CACHE_TTL_SECONDS = 21600
+    _OBSERVATIONS_URL = f"{BASE_URL}/series/observations"
+    _SERIES_URL = f"{BASE_URL}/series"
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get("FRED_API_KEY")
@@ -53,7 +62,6 @@ class FREDConnector(BaseMetricConnector):
                 source=self.SOURCE_NAME
             )
 
-        url = f"{self.BASE_URL}/series/observations"
         params = {
             "series_id": config.series_id,
             "api_key": self.api_key,
@@ -61,17 +69,27 @@ class FREDConnector(BaseMetricConnector):
             "sort_order": "desc",
             "limit": 500,  # Get plenty of history
         }
+        if config.lookback_days:
+            # Only ask for the window the dashboard will show
+            start = date.today() - timedelta(days=config.lookback_days)
+            params["observation_start"] = start.isoformat()
 
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            response = cached_get(
+                self._OBSERVATIONS_URL,
+                params=params,
+                ttl=self.CACHE_TTL_SECONDS,
+                timeout=30,
+            )
+            if not response.ok:
+                return self._http_error(response)
+            data = parse_json(response)
 
             if "observations" not in data:
                 return FetchResult(
                     success=False,
                     data=[],
-                    error=f"Unexpected response format: {list(data.keys())}",
+                    error="Unexpected response format: missing observations",
                     source=self.SOURCE_NAME
                 )
 
@@ -85,7 +103,7 @@ class FREDConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -101,6 +119,9 @@ class FREDConnector(BaseMetricConnector):
         - Date parsing
         """
         observations = []
+        metric_id, unit = config.metric_id, config.unit
+        multiplier, decimals = config.multiplier, config.decimals
+        retrieved_at = datetime.now()
 
         for item in raw_data:
             # Skip missing values
@@ -109,28 +130,29 @@ class FREDConnector(BaseMetricConnector):
                 continue
 
             try:
-                value = float(value_str) * config.multiplier
+                value = float(value_str) * multiplier
             except ValueError:
                 continue
 
             obs = Observation(
-                metric_id=config.metric_id,
+                metric_id=metric_id,
                 obs_date=item["date"],  # Already YYYY-MM-DD
-                value=round(value, config.decimals),
-                unit=config.unit,
+                value=round(value, decimals),
+                unit=unit,
                 source=self.SOURCE_NAME,
-                retrieved_at=datetime.now()
+                retrieved_at=retrieved_at
             )
             observations.append(obs)
 
         return observations
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check FRED API availability."""
         try:
             # Fetch a known stable series
-            response = requests.get(
-                f"{self.BASE_URL}/series",
+            response = HEALTH_SESSION.get(
+                self._SERIES_URL,
                 params={
                     "series_id": "GNPCA",  # Real GNP, very stable
                     "api_key": self.api_key,
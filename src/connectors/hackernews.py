@@ -18,6 +18,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 
+from ._http import SESSION, describe_error, parse_json
 from .base import BaseFeedConnector, FeedConfig, FetchResult
 from ..storage.models import Story
 
@@ -44,11 +45,11 @@ class HNFirebaseConnector(BaseFeedConnector):
         try:
             # Get story IDs
             ids_url = f"{self.BASE_URL}/{endpoint}.json"
-            response = requests.get(ids_url, timeout=15)
+            response = SESSION.get(ids_url, timeout=15)
             response.raise_for_status()
-            story_ids = response.json()[:limit]
+            story_ids = parse_json(response)[:limit]
 
-            # Fetch individual stories in parallel
+            # Fetch individual stories in parallel over the shared keep-alive pool
             stories = []
             with ThreadPoolExecutor(max_workers=10) as executor:
                 futures = {
@@ -73,25 +74,27 @@ class HNFirebaseConnector(BaseFeedConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
     def _fetch_item(self, item_id: int) -> Optional[dict]:
         """Fetch a single HN item."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{self.BASE_URL}/item/{item_id}.json",
                 timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
         except Exception:
             return None
 
     def normalize(self, config: FeedConfig, raw_data: list[Any]) -> list[Story]:
         """Convert HN items to Story objects."""
         stories = []
+        feed_id = config.id
+        retrieved_at = datetime.now()
 
         for item in raw_data:
             if not item:
@@ -111,8 +114,8 @@ class HNFirebaseConnector(BaseFeedConnector):
                 author=item.get("by", ""),
                 posted_at=posted_at,
                 source=self.SOURCE_NAME,
-                feed_id=config.id,
-                retrieved_at=datetime.now()
+                feed_id=feed_id,
+                retrieved_at=retrieved_at
             )
             stories.append(story)
 
@@ -194,13 +197,15 @@ class HNAlgoliaConnector(BaseFeedConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
     def normalize(self, config: FeedConfig, raw_data: list[Any]) -> list[Story]:
         """Convert Algolia hits to Story objects."""
         stories = []
+        feed_id = config.id
+        retrieved_at = datetime.now()
 
         for hit in raw_data:
             # Parse ISO timestamp
@@ -222,8 +227,8 @@ class HNAlgoliaConnector(BaseFeedConnector):
                 author=hit.get("author", ""),
                 posted_at=posted_at,
                 source=self.SOURCE_NAME,
-                feed_id=config.id,
-                retrieved_at=datetime.now()
+                feed_id=feed_id,
+                retrieved_at=retrieved_at
             )
             stories.append(story)
 
@@ -10,21 +10,33 @@ API Notes:
 - No authentication required for public datasets
 - Leaderboard data: open-llm-leaderboard/contents
 """
-import re
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from typing import Any
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
+_SCORE = itemgetter("score")
+
 
 class HuggingFaceConnector(BaseMetricConnector):
     """Connector for HuggingFace Open LLM Leaderboard."""
 
     SOURCE_NAME = "huggingface"
     BASE_URL = "https://huggingface.co"
+    CACHE_TTL_SECONDS = 3600
 
     # Datasets Server API - provides structured access to HuggingFace datasets
     DATASETS_SERVER = "https://datasets-server.huggingface.co"
@@ -32,6 +44,8 @@ class HuggingFaceConnector(BaseMetricConnector):
     # Sample offsets to scan the leaderboard (dataset is sorted alphabetically)
     SAMPLE_OFFSETS = [0, 1000, 2000, 3000, 4000]
     BATCH_SIZE = 100
+    # Number of leading models kept in the fetch result
+    TOP_N = 10
 
     def fetch(self, config: ConnectorConfig) -> FetchResult:
         """
@@ -46,48 +60,30 @@ class HuggingFaceConnector(BaseMetricConnector):
         Returns:
             FetchResult with leaderboard data including top model and score
         """
-        all_models = []
-
         try:
-            # Fetch from multiple offsets to sample the full dataset
-            for offset in self.SAMPLE_OFFSETS:
-                url = (
-                    f"{self.DATASETS_SERVER}/rows"
-                    f"?dataset=open-llm-leaderboard/contents"
-                    f"&config=default&split=train"
-                    f"&offset={offset}&length={self.BATCH_SIZE}"
-                )
-
-                response = requests.get(url, timeout=30)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    for row_data in data.get("rows", []):
-                        row = row_data.get("row", {})
-                        model_html = row.get("Model", "")
-
-                        # Extract model name from HTML anchor tag
-                        match = re.search(r">([^<]+)</a>", model_html)
-                        name = match.group(1) if match else model_html
-
-                        avg_score = row.get("Average ⬆️", 0)
-                        if avg_score and name:
-                            all_models.append({
-                                "name": name,
-                                "score": float(avg_score)
-                            })
-
-            if all_models:
-                # Sort by score descending
-                all_models.sort(key=lambda x: x["score"], reverse=True)
-
+            # Offsets are independent: fetch them concurrently so the total
+            # wait is ~one round-trip instead of len(SAMPLE_OFFSETS) of them.
+            # Each page is cut to its own top-N before it is returned, so a
+            # finished page holds TOP_N models rather than BATCH_SIZE.
+            top_models: list[dict] = []
+            sample_size = 0
+            with ThreadPoolExecutor(max_workers=len(self.SAMPLE_OFFSETS)) as executor:
+                for page_top, page_size in executor.map(
+                    self._fetch_offset, self.SAMPLE_OFFSETS
+                ):
+                    sample_size += page_size
+                    top_models = heapq.nlargest(
+                        self.TOP_N, chain(top_models, page_top), key=_SCORE
+                    )
+
+            if top_models:
                 return FetchResult(
                     success=True,
                     data={
-                        "top_models": all_models[:10],
-                        "top_score": all_models[0]["score"],
-                        "top_model": all_models[0]["name"],
-                        "sample_size": len(all_models)
+                        "top_models": top_models,
+                        "top_score": top_models[0]["score"],
+                        "top_model": top_models[0]["name"],
+                        "sample_size": sample_size
                     },
                     source=self.SOURCE_NAME
                 )
@@ -104,10 +100,50 @@ class HuggingFaceConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
+    def _fetch_offset(self, offset: int) -> tuple[list[dict], int]:
+        """
+        Fetch one page of leaderboard rows and keep its top-scoring models.
+
+        Args:
+            offset: Row offset into the leaderboard dataset
+
+        Returns:
+            The page's TOP_N {"name", "score"} dicts (highest first) and the
+            number of scored models on the page; ([], 0) on a non-200 response
+        """
+        url = (
+            f"{self.DATASETS_SERVER}/rows"
+            f"?dataset=open-llm-leaderboard/contents"
+            f"&config=default&split=train"
+            f"&offset={offset}&length={self.BATCH_SIZE}"
+        )
+
+        response = cached_get(url, ttl=self.CACHE_TTL_SECONDS, timeout=30)
+        if response.status_code != 200:
+            return [], 0
+
+        models = []
+        for row_data in parse_json(response).get("rows", []):
+            row = row_data.get("row", {})
+            model_html = row.get("Model", "")
+
+            # Extract model name from the first HTML anchor tag:
+            # <a href="...">org/model-name</a> <a ...>📑</a> -> org/model-name
+            anchor, closed, _ = model_html.partition("</a>")
+            name = anchor.rpartition(">")[2] if closed else model_html
+
+            avg_score = row.get("Average ⬆️", 0)
+            if avg_score and name:
+                models.append({
+                    "name": name,
+                    "score": float(avg_score)
+                })
+        return heapq.nlargest(self.TOP_N, models, key=_SCORE), len(models)
+
     def normalize(
         self, config: ConnectorConfig, raw_data: Any
     ) -> list[Observation]:
@@ -120,7 +156,8 @@ class HuggingFaceConnector(BaseMetricConnector):
         Returns a single observation with the top score from the leaderboard.
         """
         observations = []
-        today = datetime.now().strftime("%Y-%m-%d")
+        retrieved_at = datetime.now()
+        today = retrieved_at.date().isoformat()
 
         if isinstance(raw_data, dict) and "top_score" in raw_data:
             top_score = raw_data["top_score"]
@@ -132,12 +169,13 @@ class HuggingFaceConnector(BaseMetricConnector):
                 value=round(top_score * config.multiplier, config.decimals),
                 unit=config.unit,
                 source=self.SOURCE_NAME,
-                retrieved_at=datetime.now()
+                retrieved_at=retrieved_at
             )
             observations.append(obs)
 
         return observations
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check HuggingFace Datasets Server availability."""
         try:
@@ -147,7 +185,7 @@ class HuggingFaceConnector(BaseMetricConnector):
                 f"?dataset=open-llm-leaderboard/contents"
                 f"&config=default&split=train&offset=0&length=1"
             )
-            response = requests.get(url, timeout=10)
+            response = HEALTH_SESSION.get(url, timeout=10)
             return response.status_code == 200
         except requests.RequestException:
             return False
@@ -13,20 +13,31 @@ API Notes:
 - Returns annual data
 - Includes historical data and forecasts
 """
+import logging
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
+logger = logging.getLogger(__name__)
+
 
 class IMFConnector(BaseMetricConnector):
     """Connector for IMF DataMapper API."""
 
     SOURCE_NAME = "imf"
     BASE_URL = "https://www.imf.org/external/datamapper/api/v1"
+    CACHE_TTL_SECONDS = 86400
 
     def fetch(self, config: ConnectorConfig) -> FetchResult:
         """
@@ -51,9 +62,9 @@ class IMFConnector(BaseMetricConnector):
         url = f"{self.BASE_URL}/{config.indicator}/{country}"
 
         try:
-            response = requests.get(url, timeout=30)
+            response = cached_get(url, ttl=self.CACHE_TTL_SECONDS, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             if "values" not in data:
                 return FetchResult(
@@ -73,7 +84,7 @@ class IMFConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -93,6 +104,7 @@ class IMFConnector(BaseMetricConnector):
         }
         """
         observations = []
+        retrieved_at = datetime.now()
 
         try:
             # Get the indicator data
@@ -117,22 +129,25 @@ class IMFConnector(BaseMetricConnector):
                     value=round(float(value) * config.multiplier, config.decimals),
                     unit=config.unit,
                     source=self.SOURCE_NAME,
-                    retrieved_at=datetime.now()
+                    retrieved_at=retrieved_at
                 )
                 observations.append(obs)
 
-        except (KeyError, ValueError, TypeError) as e:
-            print(f"IMF parse warning: {e}")
+        except (KeyError, ValueError, TypeError):
+            logger.warning(
+                "IMF parse warning for %s", config.metric_id, exc_info=True
+            )
 
         # Sort by date descending
-        observations.sort(key=lambda x: x.obs_date, reverse=True)
+        observations.sort(key=attrgetter("obs_date"), reverse=True)
         return observations
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check IMF DataMapper API availability."""
         try:
             # Fetch a known stable indicator (World GDP growth)
-            response = requests.get(
+            response = HEALTH_SESSION.get(
                 f"{self.BASE_URL}/NGDP_RPCH/WLD",
                 timeout=10
             )
@@ -14,20 +14,48 @@ API Notes:
 - Base URL: https://sdmx.oecd.org/public/rest
 - Rate limit: Reasonable use expected
 """
+import logging
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Optional
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    QUARTER_MONTH,
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
+logger = logging.getLogger(__name__)
+
+
+def _data_url(base_url: str, dataflow: str, series_key: str) -> str:
+    """Build the SDMX data URL for an OECD short-term statistics dataflow."""
+    return f"{base_url}/OECD.SDD.STES,DSD_{dataflow}@DF_{dataflow}/{series_key}"
+
+
+def _data_urls(
+    base_url: str, metric_map: dict[str, Optional[tuple[str, str]]]
+) -> dict[str, str]:
+    """Build data URLs for every mapped metric_id in metric_map."""
+    return {
+        metric_id: _data_url(base_url, *mapping)
+        for metric_id, mapping in metric_map.items()
+        if mapping
+    }
+
 
 class OECDConnector(BaseMetricConnector):
     """Connector for OECD SDMX API."""
 
     SOURCE_NAME = "oecd"
     BASE_URL = "https://sdmx.oecd.org/public/rest/data"
+    CACHE_TTL_SECONDS = 21600
 
     # OECD dataflow and key mappings
     # Format: metric_id -> (dataflow, key_parts)
@@ -50,6 +78,15 @@ class OECDConnector(BaseMetricConnector):
         "global.dxy": None,  # Not available from OECD
         "global.brent": ("MEI", "OECD.OILBRNT.STSA.M"),
     }
+    # Data URLs for METRIC_MAP entries, built once at class creation
+    _URL_CACHE = _data_urls(BASE_URL, METRIC_MAP)
+    _DATA_PARAMS = {
+        "startPeriod": "2020-01",
+        "dimensionAtObservation": "AllDimensions"
+    }
+    _DATA_HEADERS = {
+        "Accept": "application/vnd.sdmx.data+json;charset=utf-8;version=1.0"
+    }
 
     def fetch(self, config: ConnectorConfig) -> FetchResult:
         """
@@ -75,21 +112,21 @@ class OECDConnector(BaseMetricConnector):
                 source=self.SOURCE_NAME
             )
 
-        url = f"{self.BASE_URL}/OECD.SDD.STES,DSD_{dataflow}@DF_{dataflow}/{series_key}"
-
-        params = {
-            "startPeriod": "2020-01",
-            "dimensionAtObservation": "AllDimensions"
-        }
-
-        headers = {
-            "Accept": "application/vnd.sdmx.data+json;charset=utf-8;version=1.0"
-        }
+        if config.dataflow or config.series_key:
+            url = _data_url(self.BASE_URL, dataflow, series_key)
+        else:
+            url = self._URL_CACHE[config.metric_id]
 
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = cached_get(
+                url,
+                params=self._DATA_PARAMS,
+                ttl=self.CACHE_TTL_SECONDS,
+                headers=self._DATA_HEADERS,
+                timeout=30,
+            )
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             return FetchResult(
                 success=True,
@@ -101,7 +138,7 @@ class OECDConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -110,6 +147,7 @@ class OECDConnector(BaseMetricConnector):
         Convert OECD SDMX-JSON data to observations.
         """
         observations = []
+        retrieved_at = datetime.now()
 
         try:
             datasets = raw_data.get("data", {}).get("dataSets", [])
@@ -129,7 +167,8 @@ class OECDConnector(BaseMetricConnector):
             if not time_dim:
                 return []
 
-            time_values = {str(i): v["id"] for i, v in enumerate(time_dim.get("values", []))}
+            # Observation keys are string indices into this list
+            time_values = [v["id"] for v in time_dim.get("values", [])]
 
             # Parse observations
             series = datasets[0].get("series", {})
@@ -143,7 +182,10 @@ class OECDConnector(BaseMetricConnector):
                     if value is None:
                         continue
 
-                    time_period = time_values.get(time_idx, "")
+                    try:
+                        time_period = time_values[int(time_idx)]
+                    except (ValueError, IndexError):
+                        continue
                     obs_date = self._parse_time_period(time_period)
 
                     if not obs_date:
@@ -155,47 +197,41 @@ class OECDConnector(BaseMetricConnector):
                         value=round(float(value) * config.multiplier, config.decimals),
                         unit=config.unit,
                         source=self.SOURCE_NAME,
-                        retrieved_at=datetime.now()
+                        retrieved_at=retrieved_at
                     )
                     observations.append(obs)
 
-        except (KeyError, ValueError, TypeError) as e:
-            print(f"OECD parse warning: {e}")
+        except (KeyError, ValueError, TypeError):
+            logger.warning(
+                "OECD parse warning for %s", config.metric_id, exc_info=True
+            )
 
         # Sort by date descending
-        observations.sort(key=lambda x: x.obs_date, reverse=True)
+        observations.sort(key=attrgetter("obs_date"), reverse=True)
         return observations
 
     def _parse_time_period(self, period: str) -> str:
-        """Convert OECD time period to YYYY-MM-DD format."""
-        if not period:
-            return ""
-
-        try:
-            # Monthly: 2024-01 -> 2024-01-01
-            if len(period) == 7 and "-" in period:
-                return f"{period}-01"
-
+        """Convert OECD time period to YYYY-MM-DD format ("" if unrecognised)."""
+        # Quarterly first: "2024-Q1" is also 7 chars with a dash
+        year, sep, quarter = period.partition("-Q")
+        if sep:
             # Quarterly: 2024-Q1 -> 2024-01-01
-            if "Q" in period:
-                year = period[:4]
-                quarter = period[-1]
-                month_map = {"1": "01", "2": "04", "3": "07", "4": "10"}
-                month = month_map.get(quarter, "01")
-                return f"{year}-{month}-01"
+            return f"{year}-{QUARTER_MONTH.get(quarter, '01')}-01"
 
+        n = len(period)
+        if n == 7 and period[4] == "-":
+            # Monthly: 2024-01 -> 2024-01-01
+            return f"{period}-01"
+        if n == 4 and period.isdigit():
             # Annual: 2024 -> 2024-01-01
-            if len(period) == 4 and period.isdigit():
-                return f"{period}-01-01"
-
-            return ""
-        except Exception:
-            return ""
+            return f"{period}-01-01"
+        return ""
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check OECD API availability."""
         try:
-            response = requests.get(
+            response = HEALTH_SESSION.get(
                 f"{self.BASE_URL}/OECD.SDD.STES,DSD_PRICES_CPI@DF_PRICES_CPI/USA.CPALTT01.GY.M",
                 params={"startPeriod": "2024-01"},
                 headers={"Accept": "application/vnd.sdmx.data+json"},
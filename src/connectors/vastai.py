@@ -18,7 +18,13 @@ import statistics
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
 
@@ -27,6 +33,7 @@ class VastAIConnector(BaseMetricConnector):
 
     SOURCE_NAME = "vastai"
     BASE_URL = "https://console.vast.ai/api/v0"
+    CACHE_TTL_SECONDS = 300
 
     # GPU model mapping for filtering
     GPU_MODELS = {
@@ -36,6 +43,11 @@ class VastAIConnector(BaseMetricConnector):
         "RTX_4090": ["RTX 4090", "4090"],
         "RTX_3090": ["RTX 3090", "3090"],
     }
+    # GPU_MODELS patterns lowercased once for case-insensitive matching
+    _GPU_PATTERNS_LOWER = {
+        model: tuple(p.lower() for p in patterns)
+        for model, patterns in GPU_MODELS.items()
+    }
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get("VASTAI_API_KEY")
@@ -67,7 +79,13 @@ class VastAIConnector(BaseMetricConnector):
                 "limit": 100,
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = cached_get(
+                url,
+                params=params,
+                ttl=self.CACHE_TTL_SECONDS,
+                headers=headers,
+                timeout=30,
+            )
 
             # Handle auth requirement gracefully
             if response.status_code == 401:
@@ -79,7 +97,7 @@ class VastAIConnector(BaseMetricConnector):
                 )
 
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             return FetchResult(
                 success=True,
@@ -91,7 +109,7 @@ class VastAIConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -104,7 +122,8 @@ class VastAIConnector(BaseMetricConnector):
         Extracts median spot price for the specified GPU model.
         """
         observations = []
-        today = datetime.now().strftime("%Y-%m-%d")
+        retrieved_at = datetime.now()
+        today = retrieved_at.date().isoformat()
 
         # Handle fallback case
         if isinstance(raw_data, dict) and raw_data.get("fallback"):
@@ -125,7 +144,7 @@ class VastAIConnector(BaseMetricConnector):
                 value=round(price * config.multiplier, config.decimals),
                 unit=config.unit,
                 source=self.SOURCE_NAME,
-                retrieved_at=datetime.now()
+                retrieved_at=retrieved_at
             )
             observations.append(obs)
             return observations
@@ -135,13 +154,13 @@ class VastAIConnector(BaseMetricConnector):
         offers = raw_data.get("offers", [])
 
         # Filter offers by GPU model
-        gpu_patterns = self.GPU_MODELS.get(gpu_model, [gpu_model])
+        gpu_patterns = self._GPU_PATTERNS_LOWER.get(gpu_model, (gpu_model.lower(),))
         prices = []
 
         for offer in offers:
-            gpu_name = offer.get("gpu_name", "")
+            gpu_name = offer.get("gpu_name", "").lower()
             # Check if this offer matches our GPU filter
-            if any(pattern.lower() in gpu_name.lower() for pattern in gpu_patterns):
+            if any(pattern in gpu_name for pattern in gpu_patterns):
                 price = offer.get("dph_total")  # Dollars per hour total
                 if price and price > 0:
                     prices.append(price)
@@ -155,16 +174,17 @@ class VastAIConnector(BaseMetricConnector):
                 value=round(median_price * config.multiplier, config.decimals),
                 unit=config.unit,
                 source=self.SOURCE_NAME,
-                retrieved_at=datetime.now()
+                retrieved_at=retrieved_at
             )
             observations.append(obs)
 
         return observations
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check Vast.ai API availability."""
         try:
-            response = requests.get(
+            response = HEALTH_SESSION.get(
                 f"{self.BASE_URL}/bundles/",
                 params={"limit": 1},
                 timeout=10
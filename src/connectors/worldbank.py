@@ -12,19 +12,46 @@ API Notes:
 - Returns array: [metadata, data]
 """
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
 
+@lru_cache(maxsize=256)
+def _indicator_url(base_url: str, country: str, indicator: str) -> str:
+    """Indicator endpoint for a country, built once per pair."""
+    return f"{base_url}/country/{country}/indicator/{indicator}"
+
+
+def _obs_date(date_str: str) -> str:
+    """World Bank dates are usually just years: 2023 -> 2023-01-01."""
+    if len(date_str) == 4:
+        return f"{date_str}-01-01"
+    return date_str
+
+
 class WorldBankConnector(BaseMetricConnector):
     """Connector for World Bank Indicators API."""
 
     SOURCE_NAME = "worldbank"
     BASE_URL = "https://api.worldbank.org/v2"
+    CACHE_TTL_SECONDS = 86400
+    _INDICATOR_PARAMS = {
+        "format": "json",
+        "per_page": 100,
+        "mrv": 50,  # Most recent values
+    }
 
     def fetch(self, config: ConnectorConfig) -> FetchResult:
         """
@@ -46,17 +73,17 @@ class WorldBankConnector(BaseMetricConnector):
 
         country = config.country or "WLD"  # Default to World aggregate
 
-        url = f"{self.BASE_URL}/country/{country}/indicator/{config.indicator}"
-        params = {
-            "format": "json",
-            "per_page": 100,
-            "mrv": 50,  # Most recent values
-        }
+        url = _indicator_url(self.BASE_URL, country, config.indicator)
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = cached_get(
+                url,
+                params=self._INDICATOR_PARAMS,
+                ttl=self.CACHE_TTL_SECONDS,
+                timeout=30,
+            )
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             # World Bank returns [metadata, data_array]
             if not isinstance(data, list) or len(data) < 2:
@@ -77,7 +104,7 @@ class WorldBankConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -93,41 +120,33 @@ class WorldBankConnector(BaseMetricConnector):
             "value": 123.45
         }
         """
-        observations = []
-
-        for item in raw_data:
-            if item is None:
-                continue
-
-            value = item.get("value")
-            if value is None:
-                continue
-
-            # World Bank dates are usually just years
-            date_str = item.get("date", "")
-            if len(date_str) == 4:
-                obs_date = f"{date_str}-01-01"
-            else:
-                obs_date = date_str
-
-            obs = Observation(
-                metric_id=config.metric_id,
-                obs_date=obs_date,
-                value=round(float(value) * config.multiplier, config.decimals),
-                unit=config.unit,
-                source=self.SOURCE_NAME,
-                retrieved_at=datetime.now()
+        metric_id, unit = config.metric_id, config.unit
+        multiplier, decimals = config.multiplier, config.decimals
+        retrieved_at = datetime.now()
+        source = self.SOURCE_NAME
+
+        observations = [
+            Observation(
+                metric_id=metric_id,
+                obs_date=_obs_date(item.get("date", "")),
+                value=round(float(value) * multiplier, decimals),
+                unit=unit,
+                source=source,
+                retrieved_at=retrieved_at
             )
-            observations.append(obs)
+            for item in raw_data
+            if item is not None and (value := item.get("value")) is not None
+        ]
 
         # Sort by date descending
-        observations.sort(key=lambda x: x.obs_date, reverse=True)
+        observations.sort(key=attrgetter("obs_date"), reverse=True)
         return observations
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check World Bank API availability."""
         try:
-            response = requests.get(
+            response = HEALTH_SESSION.get(
                 f"{self.BASE_URL}/country/WLD/indicator/NY.GDP.MKTP.CD",
                 params={"format": "json", "per_page": 1},
                 timeout=10
@@ -11,20 +11,35 @@ API Notes:
 - Uses unofficial Yahoo Finance API endpoints
 - Returns real-time and historical data
 """
-from datetime import datetime
-from typing import Any, Optional
+import logging
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any
 
 import requests
 
-from .base import BaseMetricConnector, ConnectorConfig, FetchResult
+from ._http import HEALTH_SESSION, cached_get, describe_error, parse_json
+from .base import (
+    BaseMetricConnector,
+    ConnectorConfig,
+    FetchResult,
+    cached_health_check,
+)
 from ..storage.models import Observation
 
+logger = logging.getLogger(__name__)
+
 
 class YahooFinanceConnector(BaseMetricConnector):
     """Connector for Yahoo Finance market data."""
 
     SOURCE_NAME = "yahoo"
     BASE_URL = "https://query1.finance.yahoo.com/v8/finance/chart"
+    CACHE_TTL_SECONDS = 300
+    # Yahoo rejects the default requests User-Agent
+    _HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
 
     # Map our metric IDs to Yahoo Finance symbols
     SYMBOL_MAP = {
@@ -55,12 +70,15 @@ class YahooFinanceConnector(BaseMetricConnector):
         }
 
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = cached_get(
+                url,
+                params=params,
+                ttl=self.CACHE_TTL_SECONDS,
+                headers=self._HEADERS,
+                timeout=30,
+            )
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             return FetchResult(
                 success=True,
@@ -72,7 +90,7 @@ class YahooFinanceConnector(BaseMetricConnector):
             return FetchResult(
                 success=False,
                 data=[],
-                error=str(e),
+                error=describe_error(e),
                 source=self.SOURCE_NAME
             )
 
@@ -106,39 +124,39 @@ class YahooFinanceConnector(BaseMetricConnector):
             quotes = result.get("indicators", {}).get("quote", [{}])[0]
             closes = quotes.get("close", [])
 
-            for i, (ts, close) in enumerate(zip(timestamps, closes)):
+            metric_id, unit = config.metric_id, config.unit
+            multiplier, decimals = config.multiplier, config.decimals
+            retrieved_at = datetime.now()
+
+            for ts, close in zip(timestamps, closes):
                 if close is None:
                     continue
 
-                obs_date = datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
-
                 obs = Observation(
-                    metric_id=config.metric_id,
-                    obs_date=obs_date,
-                    value=round(float(close) * config.multiplier, config.decimals),
-                    unit=config.unit,
+                    metric_id=metric_id,
+                    obs_date=date.fromtimestamp(ts).isoformat(),
+                    value=round(float(close) * multiplier, decimals),
+                    unit=unit,
                     source=self.SOURCE_NAME,
-                    retrieved_at=datetime.now()
+                    retrieved_at=retrieved_at
                 )
                 observations.append(obs)
 
         except (KeyError, ValueError, TypeError) as e:
-            print(f"Yahoo Finance parse warning: {e}")
+            logger.warning("Yahoo Finance parse warning: %s", e)
 
         # Sort by date descending
-        observations.sort(key=lambda x: x.obs_date, reverse=True)
+        observations.sort(key=attrgetter("obs_date"), reverse=True)
         return observations
 
+    @cached_health_check
     def health_check(self) -> bool:
         """Check Yahoo Finance API availability."""
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = requests.get(
+            response = HEALTH_SESSION.get(
                 f"{self.BASE_URL}/BZ=F",
                 params={"interval": "1d", "range": "1d"},
-                headers=headers,
+                headers=self._HEADERS,
                 timeout=10
             )
             return response.status_code == 200
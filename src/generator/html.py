@@ -5,15 +5,20 @@ Generates a single-page dense dashboard using Jinja2 templates.
 Output is a self-contained HTML file suitable for GitHub Pages.
 """
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from urllib.parse import urlparse
 
 import yaml
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
-from ..storage.database import get_all_metric_meta, get_stories_by_feed, get_latest_observations
-from ..transforms.calculations import prepare_sparkline_data, generate_ascii_sparkline, generate_braille_sparkline
+from ..storage.database import (
+    get_all_metric_meta,
+    get_latest_observations_bulk,
+    get_stories_by_feeds,
+)
+from ..transforms.calculations import prepare_sparkline_data, generate_braille_sparkline
 
 # Symbol mappings for enhanced visual display
 SECTION_ICONS = {
@@ -140,19 +145,66 @@ TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "docs"
 CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
 
+JINJA_CACHE_DIR = TEMPLATE_DIR / ".jinja_cache"
 
+# libyaml's C loader when PyYAML was built with it; much faster than SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _environment() -> Environment:
+    """
+    Create the template environment with custom filters registered.
+
+    Built on first use. Compiled templates are cached on disk, so later
+    runs load bytecode instead of recompiling dashboard.html; if the cache
+    directory can't be created (e.g. read-only checkout), templates are
+    compiled in memory instead.
+    """
+    try:
+        JINJA_CACHE_DIR.mkdir(exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+    except OSError:
+        bytecode_cache = None
+
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+
+    # Register custom filters for symbol enhancements
+    env.filters["section_icon"] = get_section_icon
+    env.filters["heat_symbol"] = get_heat_symbol
+    env.filters["time_symbol"] = get_time_symbol
+    env.filters["direction_arrow"] = get_directional_arrow
+    return env
+
+
+# Exact-unit formatters for format_value; "$"-containing units are matched separately
+_VALUE_FORMATTERS: dict[str, Callable[[float], str]] = {
+    "%": lambda v: f"{v:.1f}%",
+    "bp": lambda v: f"{v:.0f}bp",
+    "index": lambda v: f"{v:.1f}",
+}
+
+
+@lru_cache(maxsize=1)
 def load_config() -> dict:
     """
     Load metric and feed configurations from YAML files.
 
+    Parsed once per process; callers must treat the result as read-only.
+
     Returns:
         Dictionary containing 'metrics' and 'feeds' configurations
     """
     with open(CONFIG_DIR / "metrics.yaml") as f:
-        metrics_config = yaml.safe_load(f)
+        metrics_config = yaml.load(f, Loader=_YAML_LOADER)
 
     with open(CONFIG_DIR / "feeds.yaml") as f:
-        feeds_config = yaml.safe_load(f)
+        feeds_config = yaml.load(f, Loader=_YAML_LOADER)
 
     return {
         "metrics": metrics_config,
@@ -174,14 +226,11 @@ def format_value(value: Optional[float], unit: Optional[str]) -> str:
     if value is None:
         return "—"
 
-    if unit == "%":
-        return f"{value:.1f}%"
-    elif unit == "bp":
-        return f"{value:.0f}bp"
+    formatter = _VALUE_FORMATTERS.get(unit)
+    if formatter is not None:
+        return formatter(value)
     elif unit and "$" in unit:
         return f"${value:,.2f}"
-    elif unit == "index":
-        return f"{value:.1f}"
     else:
         return f"{value:,.2f}"
 
@@ -256,6 +305,15 @@ def build_dashboard_context() -> dict[str, Any]:
     # Build lookup for metric configs by ID
     metric_config_lookup = {m["id"]: m for m in config["metrics"].get("metrics", [])}
 
+    # Fetch sparkline history for every displayed metric in one query
+    group_metric_ids = [
+        metric_id
+        for group in config["metrics"].get("groups", [])
+        for metric_id in group.get("metrics", [])
+        if metric_id in meta_lookup
+    ]
+    observations_by_metric = get_latest_observations_bulk(group_metric_ids, limit=20)
+
     # Build metric groups with sparklines
     metric_groups = []
     for group in config["metrics"].get("groups", []):
@@ -265,7 +323,7 @@ def build_dashboard_context() -> dict[str, Any]:
 
             if meta:
                 # Generate sparkline from recent observations using braille patterns
-                observations = get_latest_observations(metric_id, limit=20)
+                observations = observations_by_metric[metric_id]
                 sparkline_values = prepare_sparkline_data(observations, points=16)
                 sparkline = generate_braille_sparkline(sparkline_values, width=8)
 
@@ -307,9 +365,13 @@ def build_dashboard_context() -> dict[str, Any]:
         })
 
     # Get stories organized by feed, with domain and time_ago
+    feed_configs = config["feeds"].get("feeds", [])
+    stories_by_feed = get_stories_by_feeds(
+        {feed_config["id"]: feed_config.get("limit", 20) for feed_config in feed_configs}
+    )
     feeds = []
-    for feed_config in config["feeds"].get("feeds", []):
-        stories = get_stories_by_feed(feed_config["id"], limit=feed_config.get("limit", 20))
+    for feed_config in feed_configs:
+        stories = stories_by_feed[feed_config["id"]]
         # Enrich stories with domain, time_ago, and symbols
         for story in stories:
             story["domain"] = extract_domain(story.get("url"))
@@ -342,18 +404,7 @@ def generate_dashboard() -> Path:
     Returns:
         Path to generated index.html
     """
-    env = Environment(
-        loader=FileSystemLoader(TEMPLATE_DIR),
-        autoescape=True
-    )
-
-    # Register custom filters for symbol enhancements
-    env.filters["section_icon"] = get_section_icon
-    env.filters["heat_symbol"] = get_heat_symbol
-    env.filters["time_symbol"] = get_time_symbol
-    env.filters["direction_arrow"] = get_directional_arrow
-
-    template = env.get_template("dashboard.html")
+    template = _environment().get_template("dashboard.html")
     context = build_dashboard_context()
 
     html = template.render(**context)
@@ -14,10 +14,8 @@ Usage:
 """
 import argparse
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-
-import yaml
 
 from .connectors import (
     FREDConnector,
@@ -33,8 +31,11 @@ from .connectors import (
     VastAIConnector,
     HNFirebaseConnector,
     HNAlgoliaConnector,
+    BaseFeedConnector,
+    BaseMetricConnector,
     ConnectorConfig,
     FeedConfig,
+    FetchResult,
 )
 from .storage.database import (
     init_db,
@@ -50,7 +51,7 @@ from .transforms.calculations import (
     calculate_yoy_percent,
     calculate_qoq_percent,
 )
-from .generator.html import generate_dashboard
+from .generator.html import generate_dashboard, load_config
 
 # Configure logging
 logging.basicConfig(
@@ -60,7 +61,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-CONFIG_DIR = Path(__file__).parent.parent / "config"
+# Concurrent metric fetches (I/O-bound, so threads overlap network latency)
+FETCH_WORKERS = 8
 
 
 def load_configs() -> tuple[dict, dict]:
@@ -70,11 +72,9 @@ def load_configs() -> tuple[dict, dict]:
     Returns:
         Tuple of (metrics_config, feeds_config) dictionaries
     """
-    with open(CONFIG_DIR / "metrics.yaml") as f:
-        metrics = yaml.safe_load(f)
-    with open(CONFIG_DIR / "feeds.yaml") as f:
-        feeds = yaml.safe_load(f)
-    return metrics, feeds
+    # Shared with the dashboard generator, so a full run parses the YAML once
+    config = load_config()
+    return config["metrics"], config["feeds"]
 
 
 def fetch_metrics(metrics_config: dict) -> None:
@@ -122,6 +122,7 @@ def fetch_metrics(metrics_config: dict) -> None:
                 connectors[source] = None
         return connectors.get(source)
 
+    jobs = []
     for metric in metrics_config.get("metrics", []):
         source = metric.get("source")
         connector = get_connector(source)
@@ -145,65 +146,93 @@ def fetch_metrics(metrics_config: dict) -> None:
             indicator=metric.get("indicator"),
             country=metric.get("country"),
             indicator_code=metric.get("indicator_code"),
+            lookback_days=metric.get("lookback_days"),
+            last_n_observations=metric.get("last_n_observations"),
         )
+        jobs.append((connector, config))
+
+    # Fetches are independent HTTP round-trips: run them concurrently so the
+    # total wait is ~max(latency) instead of the sum, then normalize and store
+    # in config order as each result is consumed.
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = [executor.submit(connector.fetch, config) for connector, config in jobs]
 
-        logger.info(f"Fetching {config.metric_id}...")
-
-        try:
-            observations = connector.fetch_and_normalize(config)
-
-            # Apply transforms if specified
-            if config.transform and observations:
-                logger.info(f"  Applying transform: {config.transform}")
-
-                if config.transform == "yoy_percent":
-                    transformed = calculate_yoy_percent(observations)
-                    if transformed:
-                        logger.info(f"  YoY: {len(observations)} raw -> {len(transformed)} transformed")
-                        observations = transformed
-                    else:
-                        logger.warning(f"  YoY transform returned empty (need 13+ months)")
-
-                elif config.transform == "qoq_percent":
-                    transformed = calculate_qoq_percent(observations)
-                    if transformed:
-                        logger.info(f"  QoQ: {len(observations)} raw -> {len(transformed)} transformed")
-                        observations = transformed
-                    else:
-                        logger.warning(f"  QoQ transform returned empty (need 5+ quarters)")
-
-            # Store observations
-            for obs in observations:
-                upsert_observation(obs)
-
-            # Update metric metadata with latest values
-            if observations:
-                latest = observations[0]
-                previous = observations[1] if len(observations) > 1 else None
-
-                change, change_pct = calculate_change(
-                    latest.value,
-                    previous.value if previous else None
-                )
-
-                meta = MetricMeta(
-                    id=config.metric_id,
-                    name=config.name,
-                    source=config.source,
-                    frequency=config.frequency,
-                    unit=config.unit,
-                    last_value=latest.value,
-                    last_updated=datetime.now(),
-                    previous_value=previous.value if previous else None,
-                    change=change,
-                    change_percent=change_pct,
-                )
-                update_metric_meta(meta)
-
-            logger.info(f"  -> {len(observations)} observations stored")
-
-        except Exception as e:
-            logger.error(f"  -> Failed: {e}")
+        for (connector, config), future in zip(jobs, futures):
+            logger.info(f"Storing {config.metric_id}...")
+            store_metric(connector, config, future)
+
+
+def store_metric(
+    connector: BaseMetricConnector,
+    config: ConnectorConfig,
+    future: "Future[FetchResult]",
+) -> None:
+    """
+    Normalize, transform and store the result of one metric fetch.
+
+    Args:
+        connector: Connector that produced the fetch
+        config: Metric configuration
+        future: Future resolving to the connector's FetchResult
+    """
+    try:
+        result = future.result()
+        if not result.success:
+            raise RuntimeError(f"Fetch failed: {result.error}")
+        observations = connector.normalize(config, result.data)
+
+        # Apply transforms if specified
+        if config.transform and observations:
+            logger.info(f"  Applying transform: {config.transform}")
+
+            if config.transform == "yoy_percent":
+                transformed = calculate_yoy_percent(observations)
+                if transformed:
+                    logger.info(f"  YoY: {len(observations)} raw -> {len(transformed)} transformed")
+                    observations = transformed
+                else:
+                    logger.warning(f"  YoY transform returned empty (need 13+ months)")
+
+            elif config.transform == "qoq_percent":
+                transformed = calculate_qoq_percent(observations)
+                if transformed:
+                    logger.info(f"  QoQ: {len(observations)} raw -> {len(transformed)} transformed")
+                    observations = transformed
+                else:
+                    logger.warning(f"  QoQ transform returned empty (need 5+ quarters)")
+
+        # Store observations
+        for obs in observations:
+            upsert_observation(obs)
+
+        # Update metric metadata with latest values
+        if observations:
+            latest = observations[0]
+            previous = observations[1] if len(observations) > 1 else None
+
+            change, change_pct = calculate_change(
+                latest.value,
+                previous.value if previous else None
+            )
+
+            meta = MetricMeta(
+                id=config.metric_id,
+                name=config.name,
+                source=config.source,
+                frequency=config.frequency,
+                unit=config.unit,
+                last_value=latest.value,
+                last_updated=datetime.now(),
+                previous_value=previous.value if previous else None,
+                change=change,
+                change_percent=change_pct,
+            )
+            update_metric_meta(meta)
+
+        logger.info(f"  -> {len(observations)} observations stored")
+
+    except Exception as e:
+        logger.error(f"  -> Failed: {e}")
 
 
 def fetch_feeds(feeds_config: dict) -> None:
@@ -222,6 +251,7 @@ def fetch_feeds(feeds_config: dict) -> None:
         "hn_algolia": HNAlgoliaConnector(),
     }
 
+    jobs: list[tuple[BaseFeedConnector, FeedConfig]] = []
     for feed in feeds_config.get("feeds", []):
         source = feed.get("source")
         connector = connectors.get(source)
@@ -242,23 +272,32 @@ def fetch_feeds(feeds_config: dict) -> None:
             min_score=feed.get("min_score"),
             sort_by=feed.get("sort_by"),
         )
+        jobs.append((connector, config))
+
+    # As with metrics: fetch concurrently, store sequentially in config order
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = [
+            executor.submit(connector.fetch_and_normalize, config)
+            for connector, config in jobs
+        ]
 
-        logger.info(f"Fetching feed {config.id}...")
+        for (_, config), future in zip(jobs, futures):
+            logger.info(f"Storing feed {config.id}...")
 
-        try:
-            stories = connector.fetch_and_normalize(config)
+            try:
+                stories = future.result()
 
-            # Clear old stories for this feed before inserting fresh ones
-            clear_feed_stories(config.id)
+                # Clear old stories for this feed before inserting fresh ones
+                clear_feed_stories(config.id)
 
-            # Store stories
-            for story in stories:
-                upsert_story(story)
+                # Store stories
+                for story in stories:
+                    upsert_story(story)
 
-            logger.info(f"  -> {len(stories)} stories stored")
+                logger.info(f"  -> {len(stories)} stories stored")
 
-        except Exception as e:
-            logger.error(f"  -> Failed: {e}")
+            except Exception as e:
+                logger.error(f"  -> Failed: {e}")
 
 
 def main():
@@ -5,7 +5,9 @@ from .database import (
     upsert_observation,
     upsert_story,
     get_latest_observations,
+    get_latest_observations_bulk,
     get_stories_by_feed,
+    get_stories_by_feeds,
     cleanup_old_stories,
     update_metric_meta,
     get_all_metric_meta,
@@ -19,7 +21,9 @@ __all__ = [
     "upsert_observation",
     "upsert_story",
     "get_latest_observations",
+    "get_latest_observations_bulk",
     "get_stories_by_feed",
+    "get_stories_by_feeds",
     "cleanup_old_stories",
     "update_metric_meta",
     "get_all_metric_meta",
@@ -127,6 +127,42 @@ def get_latest_observations(metric_id: str, limit: int = 120) -> list[dict]:
         return [dict(row) for row in rows]
 
 
+def get_latest_observations_bulk(
+    metric_ids: list[str], limit: int = 120
+) -> dict[str, list[dict]]:
+    """
+    Get recent observations for several metrics in one query.
+
+    Returns a mapping of metric_id to rows shaped like
+    get_latest_observations() (newest first). Metrics with no
+    observations map to an empty list.
+    """
+    result: dict[str, list[dict]] = {metric_id: [] for metric_id in metric_ids}
+    if not metric_ids:
+        return result
+
+    placeholders = ", ".join("?" * len(metric_ids))
+    with get_connection() as conn:
+        rows = conn.execute(f"""
+            WITH ranked AS (
+                SELECT metric_id, obs_date, value, unit, source, retrieved_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY metric_id ORDER BY obs_date DESC
+                       ) AS rn
+                FROM observations
+                WHERE metric_id IN ({placeholders})
+            )
+            SELECT metric_id, obs_date, value, unit, source, retrieved_at
+            FROM ranked
+            WHERE rn <= ?
+            ORDER BY metric_id, obs_date DESC
+        """, (*metric_ids, limit)).fetchall()
+    for row in rows:
+        obs = dict(row)
+        result[obs.pop("metric_id")].append(obs)
+    return result
+
+
 def get_stories_by_feed(feed_id: str, limit: int = 20) -> list[dict]:
     """Get stories for a specific feed."""
     with get_connection() as conn:
@@ -140,6 +176,46 @@ def get_stories_by_feed(feed_id: str, limit: int = 20) -> list[dict]:
         return [dict(row) for row in rows]
 
 
+def get_stories_by_feeds(feed_limits: dict[str, int]) -> dict[str, list[dict]]:
+    """
+    Get top stories for several feeds in one query.
+
+    Args:
+        feed_limits: Mapping of feed_id to the number of stories wanted
+
+    Returns:
+        Mapping of feed_id to rows shaped like get_stories_by_feed()
+        (highest score first). Feeds with no stories map to an empty list.
+    """
+    result: dict[str, list[dict]] = {feed_id: [] for feed_id in feed_limits}
+    if not feed_limits:
+        return result
+
+    limits_rows = ", ".join(["(?, ?)"] * len(feed_limits))
+    with get_connection() as conn:
+        rows = conn.execute(f"""
+            WITH limits(feed_id, max_rows) AS (VALUES {limits_rows}),
+            ranked AS (
+                SELECT s.id, s.title, s.url, s.score, s.comments, s.author,
+                       s.posted_at, s.source, s.feed_id, l.max_rows,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY s.feed_id ORDER BY s.score DESC
+                       ) AS rn
+                FROM stories s
+                JOIN limits l ON l.feed_id = s.feed_id
+            )
+            SELECT id, title, url, score, comments, author, posted_at, source,
+                   feed_id
+            FROM ranked
+            WHERE rn <= max_rows
+            ORDER BY feed_id, rn
+        """, [arg for item in feed_limits.items() for arg in item]).fetchall()
+    for row in rows:
+        story = dict(row)
+        result[story.pop("feed_id")].append(story)
+    return result
+
+
 def cleanup_old_stories(days: int = 7) -> int:
     """Remove stories older than N days. Returns count deleted."""
     cutoff = (datetime.now() - timedelta(days=days)).isoformat()
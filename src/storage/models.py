@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """A single data point for a metric."""
     metric_id: str
@@ -17,7 +17,7 @@ class Observation:
     retrieved_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Story:
     """A Hacker News story."""
     id: int  # HN item ID
@@ -32,7 +32,7 @@ class Story:
     retrieved_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricMeta:
     """Metadata about a tracked metric."""
     id: str
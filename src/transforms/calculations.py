@@ -8,11 +8,76 @@ Supports:
 - Moving averages
 - Sparkline data preparation
 """
-from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from ..storage.models import Observation
 
+# Block characters for ASCII sparklines, indexed by height 0-8
+_BLOCKS = " ▁▂▃▄▅▆▇█"
+
+# Braille encoding: each column can show 5 heights (0-4 dots from bottom)
+# Left column (dots 7,3,2,1 from bottom to top): values 64, 4, 2, 1
+# Right column (dots 8,6,5,4 from bottom to top): values 128, 32, 16, 8
+_LEFT_HEIGHTS = [0, 64, 64+4, 64+4+2, 64+4+2+1]  # 0-4 dots
+_RIGHT_HEIGHTS = [0, 128, 128+32, 128+32+16, 128+32+16+8]  # 0-4 dots
+_BRAILLE_BASE = 0x2800
+# Braille character for each (left height, right height) pair
+_BRAILLE_CHARS = [
+    [chr(_BRAILLE_BASE + left + right) for right in _RIGHT_HEIGHTS]
+    for left in _LEFT_HEIGHTS
+]
+
+# Month field "01".."12" -> (month field three months back, year offset)
+_QUARTER_BACK = {
+    f"{month:02d}": (f"{(month - 4) % 12 + 1:02d}", -1 if month <= 3 else 0)
+    for month in range(1, 13)
+}
+
+
+def _prior_year_date(obs_date: str) -> Optional[str]:
+    """Same date one year earlier (YYYY-MM-DD in, YYYY-MM-DD out), or None."""
+    year = obs_date[:4]
+    if not year.isdigit():
+        return None
+    # Fixed-format dates: decrementing the year slice is enough
+    return f"{int(year) - 1:04d}{obs_date[4:]}"
+
+
+def _prior_quarter_date(obs_date: str) -> Optional[str]:
+    """Same day three months earlier (YYYY-MM-DD in, YYYY-MM-DD out), or None."""
+    year = obs_date[:4]
+    quarter_back = _QUARTER_BACK.get(obs_date[5:7])
+    if quarter_back is None or not year.isdigit():
+        return None
+    prior_month, year_offset = quarter_back
+    return f"{int(year) + year_offset:04d}-{prior_month}{obs_date[7:]}"
+
+
+def _percent_change_from(
+    observations: list[Observation],
+    prior_date: Callable[[str], Optional[str]]
+) -> list[Observation]:
+    """Percent change of each observation against the one at prior_date(obs_date)."""
+    date_values = {obs.obs_date: obs.value for obs in observations}
+    pairs = (
+        (obs, date_values.get(prior_date(obs.obs_date)))
+        for obs in observations
+    )
+    # Missing or zero priors are skipped
+    return [
+        Observation(
+            metric_id=obs.metric_id,
+            obs_date=obs.obs_date,
+            value=round(((obs.value - prior) / prior) * 100, 2),
+            unit="%",
+            source=obs.source,
+            retrieved_at=obs.retrieved_at
+        )
+        for obs, prior in pairs
+        if prior
+    ]
+
 
 def calculate_yoy_percent(observations: list[Observation]) -> list[Observation]:
     """
@@ -30,34 +95,7 @@ def calculate_yoy_percent(observations: list[Observation]) -> list[Observation]:
     if len(observations) < 13:
         return []
 
-    # Build date->value lookup
-    date_values = {obs.obs_date: obs.value for obs in observations}
-
-    yoy_obs = []
-    for obs in observations:
-        # Find observation from ~12 months ago
-        try:
-            current_date = datetime.strptime(obs.obs_date, "%Y-%m-%d")
-            prior_date = current_date.replace(year=current_date.year - 1)
-            prior_date_str = prior_date.strftime("%Y-%m-%d")
-
-            if prior_date_str in date_values:
-                prior_value = date_values[prior_date_str]
-                if prior_value != 0:
-                    yoy_value = ((obs.value - prior_value) / prior_value) * 100
-
-                    yoy_obs.append(Observation(
-                        metric_id=obs.metric_id,
-                        obs_date=obs.obs_date,
-                        value=round(yoy_value, 2),
-                        unit="%",
-                        source=obs.source,
-                        retrieved_at=obs.retrieved_at
-                    ))
-        except (ValueError, AttributeError):
-            continue
-
-    return yoy_obs
+    return _percent_change_from(observations, _prior_year_date)
 
 
 def calculate_qoq_percent(observations: list[Observation]) -> list[Observation]:
@@ -73,38 +111,7 @@ def calculate_qoq_percent(observations: list[Observation]) -> list[Observation]:
     if len(observations) < 5:
         return []
 
-    date_values = {obs.obs_date: obs.value for obs in observations}
-
-    qoq_obs = []
-    for obs in observations:
-        try:
-            current_date = datetime.strptime(obs.obs_date, "%Y-%m-%d")
-            # Go back 3 months
-            month = current_date.month - 3
-            year = current_date.year
-            if month < 1:
-                month += 12
-                year -= 1
-            prior_date = current_date.replace(year=year, month=month)
-            prior_date_str = prior_date.strftime("%Y-%m-%d")
-
-            if prior_date_str in date_values:
-                prior_value = date_values[prior_date_str]
-                if prior_value != 0:
-                    qoq_value = ((obs.value - prior_value) / prior_value) * 100
-
-                    qoq_obs.append(Observation(
-                        metric_id=obs.metric_id,
-                        obs_date=obs.obs_date,
-                        value=round(qoq_value, 2),
-                        unit="%",
-                        source=obs.source,
-                        retrieved_at=obs.retrieved_at
-                    ))
-        except (ValueError, AttributeError):
-            continue
-
-    return qoq_obs
+    return _percent_change_from(observations, _prior_quarter_date)
 
 
 def calculate_change(
@@ -117,11 +124,14 @@ def calculate_change(
     Returns:
         (absolute_change, percent_change) or (None, None) if invalid
     """
-    if previous is None or previous == 0:
-        return (current - previous if previous is not None else None, None)
+    if previous is None:
+        return (None, None)
 
     absolute = current - previous
-    percent = (absolute / previous) * 100
+    try:
+        percent = (absolute / previous) * 100
+    except ZeroDivisionError:
+        return (absolute, None)
     return (round(absolute, 4), round(percent, 2))
 
 
@@ -144,6 +154,17 @@ def prepare_sparkline_data(
     return [obs["value"] for obs in reversed(recent)]
 
 
+def _min_max(values: tuple[float, ...]) -> tuple[float, float]:
+    """Minimum and maximum of a non-empty list in a single pass."""
+    lo = hi = values[0]
+    for v in values:
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
+
+
 def generate_ascii_sparkline(values: list[float], width: int = 10) -> str:
     """
     Generate ASCII sparkline from values using block characters.
@@ -157,28 +178,26 @@ def generate_ascii_sparkline(values: list[float], width: int = 10) -> str:
     Returns:
         String of block characters representing the trend
     """
+    return _ascii_sparkline(tuple(values), width)
+
+
+@lru_cache(maxsize=2048)
+def _ascii_sparkline(values: tuple[float, ...], width: int) -> str:
+    """Memoized body of generate_ascii_sparkline."""
     if not values:
         return ""
 
-    blocks = " ▁▂▃▄▅▆▇█"
-
-    min_val = min(values)
-    max_val = max(values)
+    min_val, max_val = _min_max(values)
 
     if max_val == min_val:
-        return blocks[4] * min(len(values), width)
+        return _BLOCKS[4] * min(len(values), width)
 
-    if len(values) > width:
-        step = len(values) / width
-        values = [values[int(i * step)] for i in range(width)]
-
-    sparkline = ""
-    for v in values:
-        normalized = (v - min_val) / (max_val - min_val)
-        idx = int(normalized * 8)
-        sparkline += blocks[idx]
+    n = len(values)
+    if n > width:
+        values = [values[i * n // width] for i in range(width)]
 
-    return sparkline
+    span = max_val - min_val
+    return "".join([_BLOCKS[int((v - min_val) / span * 8)] for v in values])
 
 
 def generate_braille_sparkline(values: list[float], width: int = 8) -> str:
@@ -202,45 +221,36 @@ def generate_braille_sparkline(values: list[float], width: int = 8) -> str:
     Returns:
         String of braille characters representing the trend
     """
+    return _braille_sparkline(tuple(values), width)
+
+
+@lru_cache(maxsize=2048)
+def _braille_sparkline(values: tuple[float, ...], width: int) -> str:
+    """Memoized body of generate_braille_sparkline."""
     if not values:
         return ""
 
-    # Braille encoding: each column can show 5 heights (0-4 dots from bottom)
-    # Left column (dots 7,3,2,1 from bottom to top): values 64, 4, 2, 1
-    # Right column (dots 8,6,5,4 from bottom to top): values 128, 32, 16, 8
-    LEFT_HEIGHTS = [0, 64, 64+4, 64+4+2, 64+4+2+1]  # 0-4 dots
-    RIGHT_HEIGHTS = [0, 128, 128+32, 128+32+16, 128+32+16+8]  # 0-4 dots
-    BRAILLE_BASE = 0x2800
-
-    min_val = min(values)
-    max_val = max(values)
+    min_val, max_val = _min_max(values)
 
     # Handle flat line
     if max_val == min_val:
-        mid = LEFT_HEIGHTS[2] + RIGHT_HEIGHTS[2]
-        return chr(BRAILLE_BASE + mid) * width
+        return _BRAILLE_CHARS[2][2] * width
 
     # Resample to fit width * 2 data points (2 per braille char)
     target_points = width * 2
-    if len(values) != target_points:
-        if len(values) > target_points:
-            step = len(values) / target_points
-            values = [values[int(i * step)] for i in range(target_points)]
-        else:
-            # Pad with last value if not enough data
-            values = values + [values[-1]] * (target_points - len(values))
-
-    # Normalize values to 0-4 range
-    def normalize(v):
-        n = (v - min_val) / (max_val - min_val)
-        return int(n * 4)
+    n = len(values)
+    if n > target_points:
+        values = [values[i * n // target_points] for i in range(target_points)]
+    elif n < target_points:
+        # Pad with last value if not enough data
+        values = values + (values[-1],) * (target_points - n)
+
+    # Normalize values to 0-4 dot heights
+    span = max_val - min_val
+    heights = [int((v - min_val) / span * 4) for v in values]
 
     # Build braille string, 2 values per character
-    sparkline = ""
-    for i in range(0, len(values), 2):
-        left_height = normalize(values[i])
-        right_height = normalize(values[i + 1]) if i + 1 < len(values) else normalize(values[i])
-        char_code = BRAILLE_BASE + LEFT_HEIGHTS[left_height] + RIGHT_HEIGHTS[right_height]
-        sparkline += chr(char_code)
-
-    return sparkline
+    return "".join([
+        _BRAILLE_CHARS[left][right]
+        for left, right in zip(heights[0::2], heights[1::2])
+    ])
@@ -0,0 +1,108 @@
+"""
+Tests for SQLite storage queries.
+
+Tests cover:
+- Bulk observation lookup matches per-metric lookup
+- Bulk story lookup matches per-feed lookup
+- Empty input and keys with no rows
+"""
+import pytest
+from datetime import date, datetime, timedelta
+
+from src.storage import database
+from src.storage.database import (
+    init_db,
+    upsert_observation,
+    upsert_story,
+    get_latest_observations,
+    get_latest_observations_bulk,
+    get_stories_by_feed,
+    get_stories_by_feeds,
+)
+from src.storage.models import Observation, Story
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Point the storage layer at a fresh database file."""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "meridian.db")
+    init_db()
+
+
+@pytest.fixture
+def seeded_observations(temp_db):
+    """Seed two metrics with different history lengths."""
+    start = date(2024, 1, 1)
+    for metric_id, count in (("gdp", 30), ("cpi", 5)):
+        for offset in range(count):
+            upsert_observation(Observation(
+                metric_id=metric_id,
+                obs_date=(start + timedelta(days=offset)).isoformat(),
+                value=float(offset),
+                unit="%",
+                source="test",
+            ))
+
+
+@pytest.fixture
+def seeded_stories(temp_db):
+    """Seed two feeds with distinct scores so ordering is unambiguous."""
+    posted_at = datetime(2024, 1, 1, 12, 0)
+    story_id = 0
+    for feed_id, count in (("hn_top", 25), ("hn_ai", 3)):
+        for rank in range(count):
+            story_id += 1
+            upsert_story(Story(
+                id=story_id,
+                title=f"Story {story_id}",
+                url=f"https://example.com/{story_id}",
+                score=1000 - story_id,
+                comments=rank,
+                author="tester",
+                posted_at=posted_at,
+                source="hn_firebase",
+                feed_id=feed_id,
+            ))
+
+
+class TestGetLatestObservationsBulk:
+    """Tests for the one-query observation lookup."""
+
+    @pytest.mark.parametrize("limit", [1, 20, 120])
+    def test_matches_single_metric_lookup(self, seeded_observations, limit):
+        """Each metric's rows match get_latest_observations()."""
+        metric_ids = ["gdp", "cpi", "unknown"]
+        result = get_latest_observations_bulk(metric_ids, limit=limit)
+
+        assert list(result) == metric_ids
+        for metric_id in metric_ids:
+            assert result[metric_id] == get_latest_observations(metric_id, limit=limit)
+
+    def test_metric_without_rows_is_empty(self, seeded_observations):
+        """Metrics with no observations map to an empty list."""
+        assert get_latest_observations_bulk(["unknown"]) == {"unknown": []}
+
+    def test_empty_input(self, temp_db):
+        """No metric ids returns an empty mapping."""
+        assert get_latest_observations_bulk([]) == {}
+
+
+class TestGetStoriesByFeeds:
+    """Tests for the one-query story lookup."""
+
+    def test_matches_single_feed_lookup(self, seeded_stories):
+        """Each feed's rows match get_stories_by_feed() at its own limit."""
+        feed_limits = {"hn_top": 10, "hn_ai": 20, "unknown": 5}
+        result = get_stories_by_feeds(feed_limits)
+
+        assert list(result) == list(feed_limits)
+        for feed_id, limit in feed_limits.items():
+            assert result[feed_id] == get_stories_by_feed(feed_id, limit=limit)
+
+    def test_feed_without_rows_is_empty(self, seeded_stories):
+        """Feeds with no stories map to an empty list."""
+        assert get_stories_by_feeds({"unknown": 20}) == {"unknown": []}
+
+    def test_empty_input(self, temp_db):
+        """No feeds returns an empty mapping."""
+        assert get_stories_by_feeds({}) == {}
@@ -20,6 +20,9 @@ from src.transforms.calculations import (
 )
 from src.storage.models import Observation
 
+# Shared retrieval time; transforms only copy it through
+_NOW = datetime.now()
+
 
 def make_observation(metric_id: str, date: str, value: float) -> Observation:
     """Helper to create Observation objects for testing."""
@@ -29,7 +32,7 @@ def make_observation(metric_id: str, date: str, value: float) -> Observation:
         value=value,
         unit="%",
         source="test",
-        retrieved_at=datetime.now()
+        retrieved_at=_NOW
     )
 
 